@@ -5,7 +5,7 @@ This package provides tools for planning and analyzing RCM operations,
 including staffing, costs, and quality metrics.
 """
 
-from .model import RCMModel
+from .model import MonthlyReport, RCMModel
 
 __version__ = '0.1.0'
-__all__ = ['RCMModel'] 
\ No newline at end of file
+__all__ = ['MonthlyReport', 'RCMModel'] 
\ No newline at end of file
@@ -2,122 +2,140 @@
 Calculation utilities for RCM staffing optimization.
 """
 
-from typing import Dict
+from typing import Dict, NamedTuple, Union
 import numpy as np
 from . import config as cfg
 
+# Productive minutes one analyst contributes per working day
+_MIN_PER_ANALYST_DAY = (
+    cfg.TIME_CONSTANTS['hours_per_day'] *
+    cfg.TIME_CONSTANTS['minutes_per_hour'] *
+    cfg.TIME_CONSTANTS['target_utilization']
+)
+
+# Handling minutes per submitted claim, for submission and denial rework
+_SUB_MIN_PER_CLAIM = cfg.PROCESS_PARAMS['avg_claim_time_min']
+_DEN_MIN_PER_CLAIM = (
+    cfg.CLAIMS_PARAMS['denial_rate'] *
+    cfg.CLAIMS_PARAMS['recovery_rate'] *
+    cfg.PROCESS_PARAMS['avg_claim_time_min'] *
+    cfg.PROCESS_PARAMS['denial_time_multiplier']
+)
+
+# Share of claim value earned as revenue
+_REVENUE_SHARE = cfg.CLAIMS_PARAMS['revenue_percentage']
+
+# Monthly labor cost per head
+_HOURS_PER_MONTH = cfg.TIME_CONSTANTS['hours_per_day'] * cfg.TIME_CONSTANTS['days_per_month']
+_ANALYST_MONTHLY_RATE = cfg.LABOR_COSTS['base_analyst'] * _HOURS_PER_MONTH
+_MANAGER_MONTHLY_RATE = cfg.LABOR_COSTS['manager'] * _HOURS_PER_MONTH
+
+# Monthly overhead per head and fixed overhead
+_ANALYST_OVERHEAD = cfg.OVERHEAD_COSTS['per_analyst']
+_MANAGER_OVERHEAD = cfg.OVERHEAD_COSTS['per_manager']
+_FIXED_OVERHEAD = cfg.OVERHEAD_COSTS['fixed_monthly']
+
+_DAYS_PER_MONTH = cfg.TIME_CONSTANTS['days_per_month']
+
+# A scalar or an array of per-month (or per-candidate) values
+Numeric = Union[float, np.ndarray]
+
+class ClaimsMetrics(NamedTuple):
+    """Claims volume for a given number of accounts."""
+    monthly_claims: Numeric
+    monthly_claims_value: Numeric
+
+class MonthResult(NamedTuple):
+    """Claims, staffing and financial metrics for a month's headcount."""
+    monthly_claims: Numeric
+    monthly_claims_value: Numeric
+    revenue: Numeric
+    submission_utilization: Numeric
+    denial_utilization: Numeric
+    submission_sla_days: Numeric
+    denial_sla_days: Numeric
+    labor_cost: Numeric
+    overhead_cost: Numeric
+    total_cost: Numeric
+    gross_margin: Numeric
+
 def calculate_time_constants() -> Dict[str, float]:
     """Calculate time-related constants."""
+    time_constants = cfg.TIME_CONSTANTS
     return {
-        'hours_per_day': cfg.TIME_CONSTANTS['hours_per_day'],
-        'minutes_per_hour': cfg.TIME_CONSTANTS['minutes_per_hour'],
-        'days_per_month': cfg.TIME_CONSTANTS['days_per_month'],
-        'target_utilization': cfg.TIME_CONSTANTS['target_utilization']
+        'hours_per_day': time_constants['hours_per_day'],
+        'minutes_per_hour': time_constants['minutes_per_hour'],
+        'days_per_month': time_constants['days_per_month'],
+        'target_utilization': time_constants['target_utilization']
     }
 
-def calculate_claims_metrics(accounts: int) -> Dict[str, float]:
+def calculate_claims_metrics(accounts: Numeric) -> ClaimsMetrics:
     """Calculate claims metrics for a given number of accounts."""
-    monthly_claims = accounts * cfg.CLAIMS_PARAMS['claims_per_account']
-    monthly_claims_value = monthly_claims * cfg.CLAIMS_PARAMS['average_claim_value']
+    claims_params = cfg.CLAIMS_PARAMS
+    monthly_claims = accounts * claims_params['claims_per_account']
+    monthly_claims_value = monthly_claims * claims_params['average_claim_value']
     
-    return {
-        'monthly_claims': monthly_claims,
-        'monthly_claims_value': monthly_claims_value
-    }
+    return ClaimsMetrics(monthly_claims, monthly_claims_value)
 
-def calculate_revenue(claims: Dict[str, float], month: int) -> float:
-    """Calculate revenue for a given month's claims."""
-    return claims['monthly_claims_value'] * cfg.CLAIMS_PARAMS['revenue_percentage']
+def calculate_revenue(monthly_claims_value: Numeric) -> Numeric:
+    """Calculate revenue for a given monthly claims value."""
+    return monthly_claims_value * _REVENUE_SHARE
 
-def calculate_staffing_metrics(
-    submission_analysts: int,
-    denial_analysts: int,
-    managers: int,
-    monthly_claims: float
-) -> Dict[str, float]:
-    """Calculate staffing metrics for given headcount."""
-    # Calculate daily volumes
-    daily_claims = monthly_claims / cfg.TIME_CONSTANTS['days_per_month']
-    daily_denials = daily_claims * cfg.CLAIMS_PARAMS['denial_rate']
-    daily_denials_rework = daily_denials * cfg.CLAIMS_PARAMS['recovery_rate']
-    
-    # Calculate available minutes
-    submission_available = (
-        submission_analysts *
-        cfg.TIME_CONSTANTS['hours_per_day'] *
-        cfg.TIME_CONSTANTS['minutes_per_hour'] *
-        cfg.TIME_CONSTANTS['target_utilization'] *
-        cfg.TIME_CONSTANTS['days_per_month']
-    )
+def calculate_gross_margin(revenue: Numeric, total_cost: Numeric) -> Numeric:
+    """Calculate gross margin, taken as zero where there is no revenue."""
+    # Guarded denominator keeps this a single select with no zero division
+    gross_margin = np.where(revenue > 0, (revenue - total_cost) / np.maximum(revenue, 1e-12), 0.0)
+    if gross_margin.ndim == 0:
+        return float(gross_margin)
+    return gross_margin
+
+def compute_month(
+    accounts: Numeric,
+    submission_analysts: Numeric,
+    denial_analysts: Numeric,
+    managers: Numeric
+) -> MonthResult:
+    """
+    Calculate all metrics for a month's accounts and headcount in one pass.
     
-    denial_available = (
-        denial_analysts *
-        cfg.TIME_CONSTANTS['hours_per_day'] *
-        cfg.TIME_CONSTANTS['minutes_per_hour'] *
-        cfg.TIME_CONSTANTS['target_utilization'] *
-        cfg.TIME_CONSTANTS['days_per_month']
-    )
+    Arguments may be scalars or broadcastable NumPy arrays.
+    """
+    claims_params = cfg.CLAIMS_PARAMS
     
-    # Calculate required minutes
-    submission_minutes_per_day = daily_claims * cfg.PROCESS_PARAMS['avg_claim_time_min']
-    denial_minutes_per_day = daily_denials_rework * cfg.PROCESS_PARAMS['avg_claim_time_min'] * cfg.PROCESS_PARAMS['denial_time_multiplier']
+    # Calculate claims volume and revenue
+    monthly_claims = accounts * claims_params['claims_per_account']
+    monthly_claims_value = monthly_claims * claims_params['average_claim_value']
+    revenue = monthly_claims_value * _REVENUE_SHARE
     
-    # Calculate utilization
-    submission_utilization = submission_minutes_per_day / submission_available
-    denial_utilization = denial_minutes_per_day / denial_available
+    # Calculate required minutes per day
+    daily_claims = monthly_claims / _DAYS_PER_MONTH
+    submission_minutes_per_day = daily_claims * _SUB_MIN_PER_CLAIM
+    denial_minutes_per_day = daily_claims * _DEN_MIN_PER_CLAIM
     
-    # Calculate SLA compliance
-    submission_sla_days = submission_minutes_per_day / (submission_available / cfg.TIME_CONSTANTS['days_per_month'])
-    denial_sla_days = denial_minutes_per_day / (denial_available / cfg.TIME_CONSTANTS['days_per_month'])
+    # Calculate SLA compliance; utilization is the share of the month needed
+    submission_sla_days = submission_minutes_per_day / (submission_analysts * _MIN_PER_ANALYST_DAY)
+    denial_sla_days = denial_minutes_per_day / (denial_analysts * _MIN_PER_ANALYST_DAY)
+    submission_utilization = submission_sla_days / _DAYS_PER_MONTH
+    denial_utilization = denial_sla_days / _DAYS_PER_MONTH
     
-    return {
-        'submission_utilization': submission_utilization,
-        'denial_utilization': denial_utilization,
-        'submission_sla_days': submission_sla_days,
-        'denial_sla_days': denial_sla_days
-    }
-
-def calculate_financial_metrics(
-    submission_analysts: int,
-    denial_analysts: int,
-    managers: int,
-    monthly_claims: float
-) -> Dict[str, float]:
-    """Calculate financial metrics for given headcount."""
-    # Calculate revenue
-    monthly_claims_value = monthly_claims * cfg.CLAIMS_PARAMS['average_claim_value']
-    revenue = monthly_claims_value * cfg.CLAIMS_PARAMS['revenue_percentage']
+    # Calculate costs and margin
+    analysts = submission_analysts + denial_analysts
+    labor_cost = analysts * _ANALYST_MONTHLY_RATE + managers * _MANAGER_MONTHLY_RATE
+    overhead_cost = analysts * _ANALYST_OVERHEAD + managers * _MANAGER_OVERHEAD + _FIXED_OVERHEAD
+    total_cost = labor_cost + overhead_cost
     
-    # Calculate labor costs
-    analyst_labor_cost = (
-        (submission_analysts + denial_analysts) *
-        cfg.LABOR_COSTS['base_analyst'] *
-        cfg.TIME_CONSTANTS['hours_per_day'] *
-        cfg.TIME_CONSTANTS['days_per_month']
-    )
+    gross_margin = calculate_gross_margin(revenue, total_cost)
     
-    manager_labor_cost = (
-        managers *
-        cfg.LABOR_COSTS['manager'] *
-        cfg.TIME_CONSTANTS['hours_per_day'] *
-        cfg.TIME_CONSTANTS['days_per_month']
+    return MonthResult(
+        monthly_claims,
+        monthly_claims_value,
+        revenue,
+        submission_utilization,
+        denial_utilization,
+        submission_sla_days,
+        denial_sla_days,
+        labor_cost,
+        overhead_cost,
+        total_cost,
+        gross_margin
     )
-    
-    total_labor_cost = analyst_labor_cost + manager_labor_cost
-    
-    # Calculate overhead costs
-    analyst_overhead = (submission_analysts + denial_analysts) * cfg.OVERHEAD_COSTS['per_analyst']
-    manager_overhead = managers * cfg.OVERHEAD_COSTS['per_manager']
-    total_overhead = analyst_overhead + manager_overhead + cfg.OVERHEAD_COSTS['fixed_monthly']
-    
-    # Calculate total costs and margin
-    total_costs = total_labor_cost + total_overhead
-    gross_margin = (revenue - total_costs) / revenue if revenue > 0 else 0
-    
-    return {
-        'revenue': revenue,
-        'labor_cost': total_labor_cost,
-        'overhead_cost': total_overhead,
-        'total_cost': total_costs,
-        'gross_margin': gross_margin
-    } 
\ No newline at end of file
@@ -19,9 +19,8 @@ def main():
     print("=== Running Staffing Optimization ===")
     optimizer = RCMOptimizer()
     results = optimizer.optimize()
-    print_optimization_results(results)
+    print_optimization_results(results, optimizer.cohorts)
     
     # Save results to CSV
-    df = model.generate_report()
-    df.to_csv('results/rcm_model_results.csv', index=False)
+    model.generate_report().to_csv('results/rcm_model_results.csv')
     print("\nResults saved to results/rcm_model_results.csv") 
\ No newline at end of file
@@ -2,116 +2,164 @@
 RCM Capacity Planning Model.
 """
 
-from typing import Dict, List
-import pandas as pd
+import csv
+import sys
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Dict
+import numpy as np
 from . import calculations as calc
 from . import config as cfg
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Per-month block of the detailed report, formatted from one report row
+_ROW_TEMPLATE = """
+Month {month} Details:
+{rule}
+
+Account & Claims Metrics:
+Active Accounts: {active_accounts:,}
+Monthly Claims: {monthly_claims:,.1f}
+Claims Value: ${monthly_claims_value:,.2f}
+
+Staffing Levels:
+Submission Analysts: {submission_analysts:,}
+Denial Analysts: {denial_analysts:,}
+Total Analysts: {total_analysts:,}
+Managers: {managers:,}
+Trainers: {trainers:,}
+QA Staff: {qa_staff:,}
+
+Utilization Metrics:
+Submission Utilization: {submission_utilization:.1%}
+Denial Utilization: {denial_utilization:.1%}
+
+SLA Metrics:
+Submission Days Needed: {submission_sla_days:.1f}
+Denial Days Needed: {denial_sla_days:.1f}
+Submission SLA Met: {submission_sla_met}
+Denial SLA Met: {denial_sla_met}
+
+Financial Metrics:
+Revenue: ${revenue:,.2f}
+Labor Cost: ${labor_cost:,.2f}
+Overhead Cost: ${overhead_cost:,.2f}
+Total Cost: ${total_cost:,.2f}
+Gross Margin: {gross_margin:.1%}
+
+{rule}
+"""
+
+class MonthlyReport(SimpleNamespace):
+    """Monthly metrics stored as one NumPy array per column."""
+    
+    def to_dataframe(self) -> 'pd.DataFrame':
+        """Convert the report to a pandas DataFrame."""
+        # Deferred so building and printing the report never imports pandas
+        import pandas as pd
+        return pd.DataFrame(vars(self))
+    
+    def to_csv(self, path: str, float_format: str = '%.4f') -> None:
+        """Write the report to a CSV file, one row per month."""
+        columns = []
+        for values in vars(self).values():
+            values = np.asarray(values)
+            if values.dtype.kind == 'f':
+                columns.append([float_format % value for value in values.tolist()])
+            else:
+                columns.append(values.tolist())
+        
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(vars(self))
+            writer.writerows(zip(*columns))
+
 class RCMModel:
     """RCM Capacity Planning Model."""
     
     def __init__(self):
         """Initialize the model."""
         self.time_constants = calc.calculate_time_constants()
+        self._report = None
     
     def calculate_monthly_metrics(self, month: int) -> Dict:
         """Calculate metrics for a given month."""
-        # Get active accounts
-        active_accounts = sum(cfg.ACCOUNTS_PER_MONTH.get(m, 0) for m in range(1, month + 1))
+        # Negative indices would otherwise wrap around to the last month
+        if month not in range(cfg.PLANNING_MONTHS):
+            raise ValueError(f"month must be in range({cfg.PLANNING_MONTHS}), got {month}")
         
-        # Calculate claims metrics
-        claims_metrics = calc.calculate_claims_metrics(active_accounts)
-        
-        # Calculate revenue
-        revenue = calc.calculate_revenue(claims_metrics, month)
+        # All months come from the single batched computation in the report
+        report = self.generate_report()
+        return {name: values[month].item() for name, values in vars(report).items()}
+    
+    def generate_report(self) -> MonthlyReport:
+        """Generate a detailed report of monthly metrics."""
+        # Inputs are fixed by config, so the report is built once per instance
+        if self._report is None:
+            self._report = self._build_report()
+        return self._report
+    
+    def _build_report(self) -> MonthlyReport:
+        """Calculate monthly metrics for all months at once."""
+        months = np.arange(cfg.PLANNING_MONTHS)
+        active_accounts = np.array(cfg.ACTIVE_ACCOUNTS_PREFIX)
+        minimum_staff = np.ones_like(months)  # Start with minimum
         
-        # Calculate staffing metrics
-        staffing_metrics = calc.calculate_staffing_metrics(
-            submission_analysts=1,  # Start with minimum
-            denial_analysts=1,     # Start with minimum
-            managers=1,            # Start with minimum
-            monthly_claims=claims_metrics['monthly_claims']
+        # Evaluate every month at once on per-month arrays
+        metrics = calc.compute_month(
+            accounts=active_accounts,
+            submission_analysts=minimum_staff,
+            denial_analysts=minimum_staff,
+            managers=minimum_staff
         )
         
-        # Calculate financial metrics
-        financial_metrics = calc.calculate_financial_metrics(
-            submission_analysts=1,  # Start with minimum
-            denial_analysts=1,     # Start with minimum
-            managers=1,            # Start with minimum
-            monthly_claims=claims_metrics['monthly_claims']
+        report = MonthlyReport(
+            month=months,
+            active_accounts=active_accounts,
+            monthly_claims=metrics.monthly_claims,
+            monthly_claims_value=metrics.monthly_claims_value,
+            revenue=metrics.revenue,
+            submission_analysts=minimum_staff.copy(),
+            denial_analysts=minimum_staff.copy(),
+            managers=minimum_staff.copy(),
+            trainers=minimum_staff.copy(),
+            qa_staff=minimum_staff.copy(),
+            submission_utilization=metrics.submission_utilization,
+            denial_utilization=metrics.denial_utilization,
+            submission_sla_days=metrics.submission_sla_days,
+            denial_sla_days=metrics.denial_sla_days,
+            labor_cost=metrics.labor_cost,
+            overhead_cost=metrics.overhead_cost,
+            total_cost=metrics.total_cost,
+            gross_margin=metrics.gross_margin
         )
         
-        return {
-            'month': month,
-            'active_accounts': active_accounts,
-            'monthly_claims': claims_metrics['monthly_claims'],
-            'monthly_claims_value': claims_metrics['monthly_claims_value'],
-            'revenue': revenue,
-            'submission_analysts': 1,  # Start with minimum
-            'denial_analysts': 1,     # Start with minimum
-            'managers': 1,            # Start with minimum
-            'trainers': 1,           # Start with minimum
-            'qa_staff': 1,           # Start with minimum
-            'submission_utilization': staffing_metrics['submission_utilization'],
-            'denial_utilization': staffing_metrics['denial_utilization'],
-            'submission_sla_days': staffing_metrics['submission_sla_days'],
-            'denial_sla_days': staffing_metrics['denial_sla_days'],
-            'labor_cost': financial_metrics['labor_cost'],
-            'overhead_cost': financial_metrics['overhead_cost'],
-            'total_cost': financial_metrics['total_cost'],
-            'gross_margin': financial_metrics['gross_margin']
-        }
-    
-    def generate_report(self) -> pd.DataFrame:
-        """Generate a detailed report of monthly metrics."""
-        data = [self.calculate_monthly_metrics(month) for month in range(0, 4)]
-        return pd.DataFrame(data)
+        # The report is cached and shared, so its columns are read-only
+        for values in vars(report).values():
+            values.setflags(write=False)
+        return report
     
     def print_detailed_report(self):
         """Print a detailed report of monthly metrics."""
-        df = self.generate_report()
+        report = self.generate_report()
         
         print("\n=== RCM Capacity Planning Model Results ===\n")
         
-        for month in range(4):
-            print(f"\nMonth {month} Details:")
-            print("="*50)
-            
-            print("\nAccount & Claims Metrics:")
-            print(f"Active Accounts: {df['active_accounts'].iloc[month]:,}")
-            print(f"Monthly Claims: {df['monthly_claims'].iloc[month]:,.1f}")
-            print(f"Claims Value: ${df['monthly_claims_value'].iloc[month]:,.2f}")
-            
-            print("\nStaffing Levels:")
-            print(f"Submission Analysts: {df['submission_analysts'].iloc[month]:,}")
-            print(f"Denial Analysts: {df['denial_analysts'].iloc[month]:,}")
-            print(f"Total Analysts: {df['submission_analysts'].iloc[month] + df['denial_analysts'].iloc[month]:,}")
-            print(f"Managers: {df['managers'].iloc[month]:,}")
-            print(f"Trainers: {df['trainers'].iloc[month]:,}")
-            print(f"QA Staff: {df['qa_staff'].iloc[month]:,}")
-            
-            print("\nUtilization Metrics:")
-            print(f"Submission Utilization: {df['submission_utilization'].iloc[month]*100:.1f}%")
-            print(f"Denial Utilization: {df['denial_utilization'].iloc[month]*100:.1f}%")
-            
-            print("\nSLA Metrics:")
-            print(f"Submission Days Needed: {df['submission_sla_days'].iloc[month]:.1f}")
-            print(f"Denial Days Needed: {df['denial_sla_days'].iloc[month]:.1f}")
-            print(f"Submission SLA Met: {'Yes' if df['submission_sla_days'].iloc[month] <= 5 else 'No'}")
-            print(f"Denial SLA Met: {'Yes' if df['denial_sla_days'].iloc[month] <= 3 else 'No'}")
-            
-            print("\nFinancial Metrics:")
-            print(f"Revenue: ${df['revenue'].iloc[month]:,.2f}")
-            print(f"Labor Cost: ${df['labor_cost'].iloc[month]:,.2f}")
-            print(f"Overhead Cost: ${df['overhead_cost'].iloc[month]:,.2f}")
-            print(f"Total Cost: ${df['total_cost'].iloc[month]:,.2f}")
-            print(f"Gross Margin: {df['gross_margin'].iloc[month]*100:.1f}%")
-            
-            print("\n" + "="*50)
+        submission_sla_met = np.where(report.submission_sla_days <= 5, 'Yes', 'No')
+        denial_sla_met = np.where(report.denial_sla_days <= 3, 'Yes', 'No')
+        total_analysts = report.submission_analysts + report.denial_analysts
         
-        # Save results to CSV
-        df.to_csv('results/rcm_model_results.csv', index=False)
-        print("\nResults saved to results/rcm_model_results.csv")
+        columns = vars(report)
+        for i in range(len(report.month)):
+            row = {name: values[i] for name, values in columns.items()}
+            sys.stdout.write(_ROW_TEMPLATE.format(
+                rule="="*50,
+                total_analysts=total_analysts[i],
+                submission_sla_met=submission_sla_met[i],
+                denial_sla_met=denial_sla_met[i],
+                **row
+            ))
 
 if __name__ == "__main__":
     # Create model instance
@@ -1,86 +1,162 @@
 """
-Optimization module for RCM staffing levels using linear programming.
+Optimization module for RCM staffing levels.
 """
 
-from typing import Dict, List
-import pulp
+import sys
+from typing import Dict
 import numpy as np
-from math import ceil
 from . import config as cfg
 from . import calculations as calc
 
+# Per-month volumes, one field per metric
+_MONTHLY_METRICS_DTYPE = np.dtype([
+    ('accounts', 'i8'),
+    ('monthly_claims', 'f8'),
+    ('daily_claims', 'f8'),
+    ('daily_denials', 'f8'),
+    ('revenue', 'f8')
+])
+
+# Optimization results, one row per month; the hires columns hold the
+# cohort that joined in that month
+_RESULT_DTYPE = np.dtype([
+    ('month', 'i8'),
+    ('active_accounts', 'i8'),
+    ('submission_hires', 'i8'),
+    ('denial_hires', 'i8'),
+    ('submission_analysts', 'i8'),
+    ('denial_analysts', 'i8'),
+    ('managers', 'i8'),
+    ('india_labor_cost', 'f8'),
+    ('india_overhead_cost', 'f8'),
+    ('us_labor_cost', 'f8'),
+    ('us_overhead_cost', 'f8'),
+    ('total_cost', 'f8'),
+    ('revenue', 'f8'),
+    ('gross_margin', 'f8')
+])
+
+# Every field is one value per month, so pd.DataFrame(results) works directly
+assert all(_RESULT_DTYPE[name].shape == () for name in _RESULT_DTYPE.names)
+
+# Per-month block of the optimization results, formatted from one result row
+_MONTH_TEMPLATE = """
+Month {month}
+------------------------------
+Active Accounts: {active_accounts:,}
+Monthly Claims: {monthly_claims:,}
+
+India Team:
+Submission Analysts: {submission_analysts:,}
+Denial Analysts: {denial_analysts:,}
+Managers: {managers:,}
+
+US Support Team:
+Delivery Lead: {delivery_leads} FTE
+Clinical Advisor: {clinical_advisors} FTE
+
+Cohort Analysis:
+Submission Analysts:
+{submission_cohort_lines}
+Denial Analysts:
+{denial_cohort_lines}
+Financial Metrics:
+India Labor Cost: ${india_labor_cost:,.2f}
+India Overhead Cost: ${india_overhead_cost:,.2f}
+US Labor Cost: ${us_labor_cost:,.2f}
+US Overhead Cost: ${us_overhead_cost:,.2f}
+Total Cost: ${total_cost:,.2f}
+Revenue: ${revenue:,.2f}
+Gross Margin: {gross_margin:.1%}
+
+{rule}
+"""
+
+# One cohort's line pair within the cohort analysis
+_COHORT_TEMPLATE = """  Month {month} cohort: {hires:,} analysts ({productivity:.0%} productivity)
+    Effective daily capacity: {capacity:,.0f} {unit}
+"""
+
+_DPM = cfg.TIME_CONSTANTS['days_per_month']
+
+# Productivity ramp by months since hire (the last step applies thereafter)
+# and full-productivity daily throughput, per process type
+_PRODUCTIVITY = {
+    process_type: np.array([ramp['productivity'][step] for step in sorted(ramp['productivity'])])
+    for process_type, ramp in cfg.PRODUCTIVITY_RAMP_UP.items()
+}
+_BASE_THROUGHPUT = {
+    process_type: ramp['base_throughput']
+    for process_type, ramp in cfg.PRODUCTIVITY_RAMP_UP.items()
+}
+
+def _build_monthly_metrics() -> np.ndarray:
+    """Calculate monthly volumes for all months at once."""
+    accounts = np.array(cfg.ACTIVE_ACCOUNTS_PREFIX)
+    claims = calc.calculate_claims_metrics(accounts)
+    
+    monthly_metrics = np.zeros(len(accounts), dtype=_MONTHLY_METRICS_DTYPE)
+    monthly_metrics['accounts'] = accounts
+    monthly_metrics['monthly_claims'] = claims.monthly_claims
+    monthly_metrics['daily_claims'] = claims.monthly_claims / _DPM
+    monthly_metrics['daily_denials'] = monthly_metrics['daily_claims'] * cfg.CLAIMS_PARAMS['denial_rate']
+    monthly_metrics['revenue'] = calc.calculate_revenue(claims.monthly_claims_value)
+    
+    # Shared by every optimizer, so it must not be modified in place
+    monthly_metrics.setflags(write=False)
+    return monthly_metrics
+
+_MONTHLY_METRICS = _build_monthly_metrics()
+
 class RCMOptimizer:
     """
-    Optimizes RCM staffing levels using linear programming to meet SLA and margin targets.
+    Optimizes RCM staffing levels to cover monthly workload at minimum cost.
     """
     
     def __init__(self):
         """Initialize the optimizer."""
         self.time_constants = calc.calculate_time_constants()
-        self.months = list(range(4))  # 0-3 months
+        self.months = list(range(cfg.PLANNING_MONTHS))  # 0-3 months
         
-        # Pre-calculate monthly volumes
-        self.monthly_metrics = []
-        for month in self.months:
-            accounts = self._get_active_accounts(month)
-            claims = calc.calculate_claims_metrics(accounts)
-            revenue = calc.calculate_revenue(claims, month)
-            
-            self.monthly_metrics.append({
-                'accounts': accounts,
-                'claims': claims,
-                'revenue': revenue
-            })
+        # Monthly volumes depend only on config, so every instance shares them
+        self.monthly_metrics = _MONTHLY_METRICS
+        
+        # Monthly labor cost per India analyst and manager
+        hours_per_month = cfg.TIME_CONSTANTS['hours_per_day'] * _DPM
+        self._analyst_labor = cfg.LABOR_COSTS['base_analyst'] * hours_per_month
+        self._manager_labor = cfg.LABOR_COSTS['manager'] * hours_per_month
+        
+        # US staffing is fixed, so its monthly cost is the same every month
+        self._us_labor_cost = (
+            cfg.US_STAFF['delivery_lead']['count'] * cfg.US_STAFF['delivery_lead']['hourly_rate'] +
+            cfg.US_STAFF['clinical_advisor']['count'] * cfg.US_STAFF['clinical_advisor']['hourly_rate']
+        ) * hours_per_month
         
-        self.model = None
-        self.results = []
         self.cohorts = {
-            'submission': {},  # Track submission analyst cohorts by month
-            'denial': {}       # Track denial analyst cohorts by month
+            'submission': np.zeros(len(self.months), dtype=int),  # Submission hires by hire month
+            'denial': np.zeros(len(self.months), dtype=int)       # Denial hires by hire month
         }
     
-    def _get_active_accounts(self, month: int) -> int:
-        """Get number of active accounts for a given month."""
-        if month == 0:
-            return 0
-        return sum(cfg.ACCOUNTS_PER_MONTH.get(m, 0) for m in range(1, month + 1))
-    
     def _calculate_effective_capacity(self, month: int, process_type: str) -> float:
         """Calculate effective capacity based on cohort productivity."""
-        total_capacity = 0
-        base_throughput = cfg.PRODUCTIVITY_RAMP_UP[process_type]['base_throughput']
-        productivity = cfg.PRODUCTIVITY_RAMP_UP[process_type]['productivity']
+        cohorts = self.cohorts[process_type]
+        ramp = _PRODUCTIVITY[process_type]
         
-        # For each cohort that exists in this month
-        for cohort_month, count in self.cohorts[process_type].items():
-            if cohort_month <= month:  # Only count cohorts that have been hired
-                # Calculate months since hire
-                months_since_hire = month - cohort_month
-                # Get productivity based on months since hire
-                if months_since_hire >= 2:
-                    # Third month or later: 100% productivity
-                    cohort_productivity = productivity[2]
-                else:
-                    # First or second month: use corresponding productivity
-                    cohort_productivity = productivity[months_since_hire]
-                # Add to total capacity
-                total_capacity += count * cohort_productivity * base_throughput
+        # Only cohorts hired by this month count, at their ramp-up productivity
+        hire_months = np.arange(len(cohorts))
+        months_since_hire = np.clip(month - hire_months, 0, len(ramp) - 1)
+        hired = hire_months <= month
         
-        return total_capacity
-
-    def _calculate_total_active_analysts(self, month: int, process_type: str) -> int:
-        """Calculate total active analysts for a given month and process type."""
-        return sum(count for cohort_month, count in self.cohorts[process_type].items() 
-                  if cohort_month <= month)
+        return _BASE_THROUGHPUT[process_type] * np.dot(cohorts * hired, ramp[months_since_hire])
 
     def _calculate_net_new_hires(self, month: int, daily_workload: float, process_type: str) -> int:
         """Calculate net new hires needed to cover capacity gap."""
         # Get monthly workload
-        monthly_workload = daily_workload * cfg.TIME_CONSTANTS['days_per_month']
+        monthly_workload = daily_workload * _DPM
         
         # Calculate current effective capacity
         current_capacity = self._calculate_effective_capacity(month, process_type)
-        monthly_capacity = current_capacity * cfg.TIME_CONSTANTS['days_per_month']
+        monthly_capacity = current_capacity * _DPM
         
         # Calculate capacity gap
         capacity_gap = max(0, monthly_workload - monthly_capacity)
@@ -89,227 +165,118 @@ class RCMOptimizer:
             return 0
         
         # Calculate net new hires needed
-        new_cohort_productivity = cfg.PRODUCTIVITY_RAMP_UP[process_type]['productivity'][0]  # 80% for new hires
-        base_throughput = cfg.PRODUCTIVITY_RAMP_UP[process_type]['base_throughput']
-        monthly_throughput = base_throughput * cfg.TIME_CONSTANTS['days_per_month']
+        new_cohort_productivity = _PRODUCTIVITY[process_type][0]  # 80% for new hires
+        monthly_throughput = _BASE_THROUGHPUT[process_type] * _DPM
         
-        net_new_hires = ceil(capacity_gap / (new_cohort_productivity * monthly_throughput))
-        return net_new_hires
+        # Ceiling division: the smallest cohort that closes the gap
+        net_new_hires = -(-capacity_gap // (new_cohort_productivity * monthly_throughput))
+        return int(net_new_hires)
 
-    def _optimize_staffing(self, month: int, active_accounts: int) -> Dict:
-        """Optimize staffing levels for a given month."""
-        # Calculate daily workload
-        monthly_claims = active_accounts * cfg.CLAIMS_PARAMS['claims_per_account']
-        daily_claims = monthly_claims / cfg.TIME_CONSTANTS['days_per_month']
-        daily_denials = daily_claims * cfg.CLAIMS_PARAMS['denial_rate']
-        
-        # Create optimization model
-        self.model = pulp.LpProblem(f"RCM_Staffing_Month_{month}", pulp.LpMinimize)
-        
-        # Calculate net new hires needed
-        new_submission_analysts = self._calculate_net_new_hires(month, daily_claims, 'submission')
-        new_denial_analysts = self._calculate_net_new_hires(month, daily_denials, 'denial')
-        
-        # Decision variables for new hires
-        new_submission_var = pulp.LpVariable('new_submission_analysts', lowBound=0, cat='Integer')
-        new_denial_var = pulp.LpVariable('new_denial_analysts', lowBound=0, cat='Integer')
-        managers = pulp.LpVariable('managers', lowBound=0, cat='Integer')
-        
-        # Calculate total analysts (existing + new hires)
-        total_submission_analysts = self._calculate_total_active_analysts(month, 'submission') + new_submission_var
-        total_denial_analysts = self._calculate_total_active_analysts(month, 'denial') + new_denial_var
-        
-        # Calculate US staff costs
-        us_labor_cost = (
-            cfg.US_STAFF['delivery_lead']['count'] * cfg.US_STAFF['delivery_lead']['hourly_rate'] +
-            cfg.US_STAFF['clinical_advisor']['count'] * cfg.US_STAFF['clinical_advisor']['hourly_rate']
-        ) * cfg.TIME_CONSTANTS['hours_per_day'] * cfg.TIME_CONSTANTS['days_per_month']
+    def plan(self):
+        """Build the hiring plan: the new cohort for each month and process type."""
+        daily_workload = {
+            'submission': self.monthly_metrics['daily_claims'],
+            'denial': self.monthly_metrics['daily_denials']
+        }
         
-        # Objective: Minimize total cost
-        total_cost = (
-            total_submission_analysts * cfg.LABOR_COSTS['base_analyst'] * cfg.TIME_CONSTANTS['hours_per_day'] * cfg.TIME_CONSTANTS['days_per_month'] +
-            total_denial_analysts * cfg.LABOR_COSTS['base_analyst'] * cfg.TIME_CONSTANTS['hours_per_day'] * cfg.TIME_CONSTANTS['days_per_month'] +
-            managers * cfg.LABOR_COSTS['manager'] * cfg.TIME_CONSTANTS['hours_per_day'] * cfg.TIME_CONSTANTS['days_per_month'] +
-            (total_submission_analysts + total_denial_analysts) * cfg.OVERHEAD_COSTS['per_analyst'] +
-            managers * cfg.OVERHEAD_COSTS['per_manager'] +
-            cfg.OVERHEAD_COSTS['fixed_monthly'] +
-            us_labor_cost +  # Add US labor costs
-            cfg.OVERHEAD_COSTS['us_overhead']  # Add US overhead
-        )
-        self.model += total_cost
+        # Fresh arrays, so a plan handed out earlier is never rewritten
+        self.cohorts = {
+            process_type: np.zeros(len(self.months), dtype=int)
+            for process_type in daily_workload
+        }
         
-        # For Month 0, we're just training for Month 1
-        if month == 0:
-            next_month_accounts = self._get_active_accounts(1)
-            next_month_claims = next_month_accounts * cfg.CLAIMS_PARAMS['claims_per_account']
-            next_month_daily_claims = next_month_claims / cfg.TIME_CONSTANTS['days_per_month']
-            next_month_daily_denials = next_month_daily_claims * cfg.CLAIMS_PARAMS['denial_rate']
+        for process_type, workload in daily_workload.items():
+            for month in self.months:
+                # Month 0 hires and trains the staff needed for month 1
+                target_month = max(month, 1)
+                self.cohorts[process_type][month] = self._calculate_net_new_hires(
+                    month, workload[target_month], process_type
+                )
             
-            # Set new hires to calculated values
-            self.model += new_submission_var == new_submission_analysts
-            self.model += new_denial_var == new_denial_analysts
-        else:
-            # Set new hires to calculated values
-            self.model += new_submission_var == new_submission_analysts
-            self.model += new_denial_var == new_denial_analysts
-        
-        # Manager ratio constraint
-        self.model += managers >= (total_submission_analysts + total_denial_analysts) / cfg.STAFF_RATIOS['analysts_per_manager'], "Manager_Ratio"
-        
-        # Solve the model
-        self.model.solve(pulp.PULP_CBC_CMD(msg=False))
-        
-        # Update cohorts for this month
-        if month == 0:
-            self.cohorts['submission'][0] = int(new_submission_var.value())
-            self.cohorts['denial'][0] = int(new_denial_var.value())
-        else:
-            # Only track new hires for this month
-            if int(new_submission_var.value()) > 0:
-                self.cohorts['submission'][month] = int(new_submission_var.value())
-            if int(new_denial_var.value()) > 0:
-                self.cohorts['denial'][month] = int(new_denial_var.value())
+            # The finished plan is read-only and safe to share without copying
+            self.cohorts[process_type].setflags(write=False)
+
+    def _optimize_staffing(self) -> np.ndarray:
+        """Calculate staffing levels and financials for every month of the plan."""
+        results = np.zeros(len(self.months), dtype=_RESULT_DTYPE)
+        results['month'] = self.months
+        results['active_accounts'] = self.monthly_metrics['accounts']
+        results['submission_hires'] = self.cohorts['submission']
+        results['denial_hires'] = self.cohorts['denial']
+        
+        # Calculate total analysts across all cohorts hired so far
+        submission_analysts = np.cumsum(self.cohorts['submission'])
+        denial_analysts = np.cumsum(self.cohorts['denial'])
+        total_analysts = submission_analysts + denial_analysts
+        
+        # Fewest managers that satisfy the analysts-per-manager ratio
+        managers = -(-total_analysts // cfg.STAFF_RATIOS['analysts_per_manager'])
         
         # Calculate financial metrics
-        india_labor_cost = (
-            total_submission_analysts.value() * cfg.LABOR_COSTS['base_analyst'] * cfg.TIME_CONSTANTS['hours_per_day'] * cfg.TIME_CONSTANTS['days_per_month'] +
-            total_denial_analysts.value() * cfg.LABOR_COSTS['base_analyst'] * cfg.TIME_CONSTANTS['hours_per_day'] * cfg.TIME_CONSTANTS['days_per_month'] +
-            managers.value() * cfg.LABOR_COSTS['manager'] * cfg.TIME_CONSTANTS['hours_per_day'] * cfg.TIME_CONSTANTS['days_per_month']
-        )
-        
+        india_labor_cost = total_analysts * self._analyst_labor + managers * self._manager_labor
         india_overhead_cost = (
-            (total_submission_analysts.value() + total_denial_analysts.value()) * cfg.OVERHEAD_COSTS['per_analyst'] +
-            managers.value() * cfg.OVERHEAD_COSTS['per_manager'] +
+            total_analysts * cfg.OVERHEAD_COSTS['per_analyst'] +
+            managers * cfg.OVERHEAD_COSTS['per_manager'] +
             cfg.OVERHEAD_COSTS['fixed_monthly']
         )
         
-        total_cost = india_labor_cost + india_overhead_cost + us_labor_cost + cfg.OVERHEAD_COSTS['us_overhead']
-        revenue = monthly_claims * cfg.CLAIMS_PARAMS['average_claim_value'] * cfg.CLAIMS_PARAMS['revenue_percentage']
-        gross_margin = (revenue - total_cost) / revenue if revenue > 0 else 0
-        
-        return {
-            'month': month,
-            'active_accounts': active_accounts,
-            'submission_analysts': int(total_submission_analysts.value()),
-            'denial_analysts': int(total_denial_analysts.value()),
-            'managers': int(managers.value()),
-            'india_labor_cost': india_labor_cost,
-            'india_overhead_cost': india_overhead_cost,
-            'us_labor_cost': us_labor_cost,
-            'us_overhead_cost': cfg.OVERHEAD_COSTS['us_overhead'],
-            'total_cost': total_cost,
-            'revenue': revenue,
-            'gross_margin': gross_margin,
-            'cohorts': self.cohorts.copy()
-        }
-    
-    def optimize(self) -> List[Dict]:
-        """Run optimization for all months."""
-        results = []
-        
-        # Month 0: Calculate and train staff needed for month 1
-        month_1_staff = self._optimize_staffing(
-            0,
-            self.monthly_metrics[1]['accounts']
-        )
-        results.append({
-            'month': 0,
-            'active_accounts': 0,
-            'submission_analysts': month_1_staff['submission_analysts'],
-            'denial_analysts': month_1_staff['denial_analysts'],
-            'managers': month_1_staff['managers'],
-            'india_labor_cost': month_1_staff['india_labor_cost'],
-            'india_overhead_cost': month_1_staff['india_overhead_cost'],
-            'us_labor_cost': month_1_staff['us_labor_cost'],
-            'us_overhead_cost': month_1_staff['us_overhead_cost'],
-            'total_cost': month_1_staff['total_cost'],
-            'revenue': 0,
-            'gross_margin': 0,
-            'cohorts': month_1_staff['cohorts']
-        })
-        
-        # Months 1-3: Optimize staffing based on workload
-        for month in range(1, 4):
-            metrics = self.monthly_metrics[month]
-            staff = self._optimize_staffing(
-                month,
-                metrics['accounts']
-            )
-            
-            results.append({
-                'month': month,
-                'active_accounts': metrics['accounts'],
-                'submission_analysts': staff['submission_analysts'],
-                'denial_analysts': staff['denial_analysts'],
-                'managers': staff['managers'],
-                'india_labor_cost': staff['india_labor_cost'],
-                'india_overhead_cost': staff['india_overhead_cost'],
-                'us_labor_cost': staff['us_labor_cost'],
-                'us_overhead_cost': staff['us_overhead_cost'],
-                'total_cost': staff['total_cost'],
-                'revenue': staff['revenue'],
-                'gross_margin': staff['gross_margin'],
-                'cohorts': staff['cohorts']
-            })
+        total_cost = india_labor_cost + india_overhead_cost + self._us_labor_cost + cfg.OVERHEAD_COSTS['us_overhead']
+        revenue = self.monthly_metrics['revenue']
+        gross_margin = calc.calculate_gross_margin(revenue, total_cost)
+        
+        results['submission_analysts'] = submission_analysts
+        results['denial_analysts'] = denial_analysts
+        results['managers'] = managers
+        results['india_labor_cost'] = india_labor_cost
+        results['india_overhead_cost'] = india_overhead_cost
+        results['us_labor_cost'] = self._us_labor_cost
+        results['us_overhead_cost'] = cfg.OVERHEAD_COSTS['us_overhead']
+        results['total_cost'] = total_cost
+        results['revenue'] = revenue
+        results['gross_margin'] = gross_margin
         
         return results
+    
+    def optimize(self) -> np.ndarray:
+        """Run optimization for all months, returning one result row per month."""
+        self.plan()
+        return self._optimize_staffing()
 
-def print_optimization_results(results: List[Dict]):
-    """Print optimization results in a readable format."""
-    print("\nRCM Staffing Optimization Results")
-    print("=" * 50)
+def print_optimization_results(results: np.ndarray, cohorts: Dict[str, np.ndarray]):
+    """Print optimization results and the hiring plan (hires by hire month) behind them."""
+    blocks = ["\nRCM Staffing Optimization Results\n" + "=" * 50 + "\n"]
     
     for result in results:
-        print(f"\nMonth {result['month']}")
-        print("-" * 30)
-        
-        print(f"Active Accounts: {result['active_accounts']:,}")
-        print(f"Monthly Claims: {result['active_accounts'] * cfg.CLAIMS_PARAMS['claims_per_account']:,}")
-        
-        print("\nIndia Team:")
-        print(f"Submission Analysts: {result['submission_analysts']:,}")
-        print(f"Denial Analysts: {result['denial_analysts']:,}")
-        print(f"Managers: {result['managers']:,}")
-        
-        print("\nUS Support Team:")
-        print(f"Delivery Lead: {cfg.US_STAFF['delivery_lead']['count']} FTE")
-        print(f"Clinical Advisor: {cfg.US_STAFF['clinical_advisor']['count']} FTE")
-        
-        print("\nCohort Analysis:")
-        print("Submission Analysts:")
-        for cohort_month, count in result['cohorts']['submission'].items():
-            if cohort_month <= result['month']:
-                months_since_hire = result['month'] - cohort_month
-                if months_since_hire >= 2:
-                    productivity = cfg.PRODUCTIVITY_RAMP_UP['submission']['productivity'][2]
-                else:
-                    productivity = cfg.PRODUCTIVITY_RAMP_UP['submission']['productivity'][months_since_hire]
-                effective_capacity = count * productivity * cfg.PRODUCTIVITY_RAMP_UP['submission']['base_throughput']
-                print(f"  Month {cohort_month} cohort: {count:,} analysts ({productivity*100:.0f}% productivity)")
-                print(f"    Effective daily capacity: {effective_capacity:,.0f} claims")
-        
-        print("\nDenial Analysts:")
-        for cohort_month, count in result['cohorts']['denial'].items():
-            if cohort_month <= result['month']:
-                months_since_hire = result['month'] - cohort_month
-                if months_since_hire >= 2:
-                    productivity = cfg.PRODUCTIVITY_RAMP_UP['denial']['productivity'][2]
-                else:
-                    productivity = cfg.PRODUCTIVITY_RAMP_UP['denial']['productivity'][months_since_hire]
-                effective_capacity = count * productivity * cfg.PRODUCTIVITY_RAMP_UP['denial']['base_throughput']
-                print(f"  Month {cohort_month} cohort: {count:,} analysts ({productivity*100:.0f}% productivity)")
-                print(f"    Effective daily capacity: {effective_capacity:,.0f} denials")
-        
-        print("\nFinancial Metrics:")
-        print(f"India Labor Cost: ${result['india_labor_cost']:,.2f}")
-        print(f"India Overhead Cost: ${result['india_overhead_cost']:,.2f}")
-        print(f"US Labor Cost: ${result['us_labor_cost']:,.2f}")
-        print(f"US Overhead Cost: ${result['us_overhead_cost']:,.2f}")
-        print(f"Total Cost: ${result['total_cost']:,.2f}")
-        print(f"Revenue: ${result['revenue']:,.2f}")
-        print(f"Gross Margin: {result['gross_margin']*100:.1f}%")
-        
-        print("\n" + "=" * 50)
+        row = {name: result[name] for name in results.dtype.names}
+        
+        # Cohorts hired so far, at this month's ramp-up productivity
+        cohort_lines = {'submission': [], 'denial': []}
+        for process_type, unit in (('submission', 'claims'), ('denial', 'denials')):
+            ramp = _PRODUCTIVITY[process_type]
+            for cohort_month, hires in enumerate(cohorts[process_type]):
+                # The month 0 cohort is always listed, even when empty
+                if cohort_month <= result['month'] and (hires > 0 or cohort_month == 0):
+                    months_since_hire = result['month'] - cohort_month
+                    productivity = ramp[min(months_since_hire, len(ramp) - 1)]
+                    cohort_lines[process_type].append(_COHORT_TEMPLATE.format(
+                        month=cohort_month,
+                        hires=hires,
+                        productivity=productivity,
+                        capacity=hires * productivity * _BASE_THROUGHPUT[process_type],
+                        unit=unit
+                    ))
+        
+        blocks.append(_MONTH_TEMPLATE.format(
+            rule="=" * 50,
+            monthly_claims=result['active_accounts'] * cfg.CLAIMS_PARAMS['claims_per_account'],
+            delivery_leads=cfg.US_STAFF['delivery_lead']['count'],
+            clinical_advisors=cfg.US_STAFF['clinical_advisor']['count'],
+            submission_cohort_lines="".join(cohort_lines['submission']),
+            denial_cohort_lines="".join(cohort_lines['denial']),
+            **row
+        ))
+    
+    sys.stdout.write("".join(blocks))
 
 if __name__ == "__main__":
     # Create optimizer instance
@@ -319,4 +286,4 @@ if __name__ == "__main__":
     results = optimizer.optimize()
     
     # Print results
-    print_optimization_results(results) 
\ No newline at end of file
+    print_optimization_results(results, optimizer.cohorts) 
\ No newline at end of file